@@ -0,0 +1,137 @@
+import threading
+from datetime import date, timedelta
+import numpy as np
+
+class CompletionMatrix:
+    """In-memory habits x days completion matrix, loaded once from habit_status and patched on each write.
+
+    Rows follow `habit_ids`; column 0 is `start`. Days without a Completed row count as not completed,
+    the same rule the dashboard uses for its success rate and streak.
+    """
+    def __init__(self, store, start=None):
+        self.store, self.lock = store, threading.RLock()
+        self.fixed_start = start
+        self.load()
+        store.subscribe(self.on_store_event)
+
+    def load(self):
+        with self.lock:
+            self.habit_ids = [hid for hid, _ in self.store.habits()]
+            self.rows = {hid: i for i, hid in enumerate(self.habit_ids)}
+            first = self.fixed_start or self.store.scalar("SELECT MIN(date) FROM habit_status WHERE status='Completed'")
+            self.start = date.fromisoformat(first) if isinstance(first, str) else first or date.today()
+            days = max((date.today() - self.start).days + 1, 1)
+            self.matrix = np.zeros((len(self.habit_ids), days), dtype=bool)
+            # One row per habit with its completed dates concatenated: far fewer Python objects than a row per cell.
+            start = np.datetime64(self.start.isoformat())
+            for habit_id, dates in self.store.query('''SELECT habit_id, group_concat(date) FROM habit_status
+                    WHERE status='Completed' AND date >= ? GROUP BY habit_id''', (self.start.isoformat(),)):
+                row = self.rows.get(habit_id)
+                if row is None: continue
+                cols = (np.array(dates.split(","), dtype="datetime64[D]") - start).astype(np.int64)
+                self.matrix[row, cols[cols < days]] = True
+
+    # =============== PATCHING ===============
+    def on_store_event(self, event, *args):
+        with self.lock:
+            if event == "toggle": self.set(args[0], args[1], args[2] == "Completed")
+            elif event == "add":
+                self.rows[args[0]] = len(self.habit_ids); self.habit_ids.append(args[0])
+                self.matrix = np.vstack([self.matrix, np.zeros((1, self.matrix.shape[1]), dtype=bool)])
+            elif event == "delete" and args[0] in self.rows:
+                self.matrix = np.delete(self.matrix, self.rows[args[0]], axis=0)
+                self.habit_ids.remove(args[0])
+                self.rows = {hid: i for i, hid in enumerate(self.habit_ids)}
+            elif event in ("reset", "reload"): self.load()
+
+    def set(self, habit_id, day, completed):
+        row = self.rows.get(habit_id)
+        if row is None: return
+        col = (date.fromisoformat(day) - self.start).days
+        if col < 0:
+            if not completed: return
+            self.matrix = np.hstack([np.zeros((self.matrix.shape[0], -col), dtype=bool), self.matrix])
+            self.start, col = self.start + timedelta(days=col), 0
+        if col >= self.matrix.shape[1]:
+            self.matrix = np.hstack([self.matrix, np.zeros((self.matrix.shape[0], col - self.matrix.shape[1] + 1), dtype=bool)])
+        self.matrix[row, col] = completed
+
+    # =============== ANALYTICS ===============
+    def column(self, day):
+        return (day - self.start).days
+
+    def upto(self, as_of):
+        # View of the matrix ending at as_of (inclusive), padded with not-completed days if as_of is past the end.
+        end = self.column(as_of) + 1
+        if end <= 0: return self.matrix[:, :0]
+        view = self.matrix[:, :end]
+        if end > view.shape[1]: view = np.hstack([view, np.zeros((view.shape[0], end - view.shape[1]), dtype=bool)])
+        return view
+
+    @staticmethod
+    def trailing_run(matrix):
+        # Length of the run of True values ending at the last column, per row.
+        if matrix.shape[1] == 0: return np.zeros(matrix.shape[0], dtype=np.int64)
+        reversed_ = matrix[:, ::-1]
+        return np.where(reversed_.all(axis=1), matrix.shape[1], np.argmin(reversed_, axis=1))
+
+    def streaks(self, as_of=None):
+        with self.lock: return dict(zip(self.habit_ids, self.trailing_run(self.upto(as_of or date.today())).tolist()))
+
+    def overall_streak(self, as_of=None):
+        with self.lock:
+            if not self.habit_ids: return 0
+            return int(self.trailing_run(self.upto(as_of or date.today()).all(axis=0)[None, :])[0])
+
+    def rates(self, windows=(7, 30, 365), as_of=None):
+        # Per-habit completion rate over the trailing window (days before the first record count as missed).
+        with self.lock:
+            view = self.upto(as_of or date.today())
+            counts = np.cumsum(view, axis=1, dtype=np.int32)
+            total = counts[:, -1] if view.shape[1] else np.zeros(len(self.habit_ids), dtype=np.int32)
+            result = {}
+            for window in windows:
+                before = counts[:, -window - 1] if view.shape[1] > window else 0
+                result[window] = dict(zip(self.habit_ids, ((total - before) / window).tolist()))
+            return result
+
+    def rolling_rate(self, window=7, as_of=None):
+        # Daily series of the all-habits completion rate averaged over the trailing window, one value per column.
+        with self.lock:
+            view = self.upto(as_of or date.today())
+            if not self.habit_ids or view.shape[1] == 0: return np.zeros(view.shape[1])
+            daily = np.concatenate([[0], np.cumsum(view.sum(axis=0))])
+            idx = np.arange(1, view.shape[1] + 1)
+            return (daily[idx] - daily[np.maximum(idx - window, 0)]) / (window * len(self.habit_ids))
+
+    def weekday_rates(self, as_of=None):
+        # Per-habit completion rate for each weekday (Mon=0 .. Sun=6) over the days since `start`.
+        with self.lock:
+            view = self.upto(as_of or date.today())
+            weekdays = (self.start.weekday() + np.arange(view.shape[1])) % 7
+            days_per_weekday = np.bincount(weekdays, minlength=7)
+            done = np.stack([view[:, weekdays == wd].sum(axis=1) for wd in range(7)], axis=1)
+            rates = np.divide(done, days_per_weekday, out=np.zeros(done.shape), where=days_per_weekday > 0)
+            return dict(zip(self.habit_ids, rates.tolist()))
+
+    def ranked(self, window=30, count=5, as_of=None):
+        # (best, worst) habit ids by completion rate over the trailing window.
+        rates = self.rates((window,), as_of)[window]
+        order = sorted(rates, key=rates.get, reverse=True)
+        return order[:count], order[::-1][:count]
+
+    def summary(self, windows=(7, 30, 365), as_of=None):
+        with self.lock:
+            return {"habits": len(self.habit_ids), "start": self.start.isoformat(),
+                    "overall_streak": self.overall_streak(as_of), "streaks": self.streaks(as_of),
+                    "rates": self.rates(windows, as_of), "weekday_rates": self.weekday_rates(as_of),
+                    "best_worst": self.ranked(as_of=as_of)}
+
+if __name__ == "__main__":
+    import argparse, json
+    from store import HabitStore, DEFAULT_DB_PATH
+    parser = argparse.ArgumentParser(description="Print vectorized habit analytics as JSON")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+    with HabitStore(args.db) as store:
+        print(json.dumps(CompletionMatrix(store).summary(), indent=2))
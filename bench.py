@@ -0,0 +1,152 @@
+"""Headless benchmarks for the data work behind HabitTrackerApp's hot paths.
+
+    python bench.py generate --db bench.db --habits 10000 --years 5 --density 0.6
+    python bench.py run --db bench.db --output results.json [--compare previous.json]
+"""
+import argparse, json, os, platform, random, sqlite3, statistics, sys, time
+from datetime import datetime, timedelta
+from store import HabitStore
+
+# =============== SYNTHETIC DATA ===============
+def generate(db_path, habits=1000, years=1, density=0.6, seed=0, end=None, chunk_size=100_000):
+    """Fill db_path with `habits` habits and `years` of daily history; each habit gets its own completion rate around `density`."""
+    rng = random.Random(seed)
+    end = end or datetime.now()
+    dates = [(end - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(int(years * 365.25) - 1, -1, -1)]
+    with HabitStore(db_path) as store:
+        with store.transaction() as conn:
+            first = conn.execute("SELECT COALESCE(MAX(id), 0) FROM habits").fetchone()[0] + 1
+            conn.executemany("INSERT INTO habits (id, name) VALUES (?, ?)", ((first + i, f"Habit {first + i}") for i in range(habits)))
+        rows, count = [], 0
+        with store.without_date_index():
+            for habit_id in range(first, first + habits):
+                rate = min(max(rng.gauss(density, 0.15), 0.0), 1.0)
+                rows.extend((habit_id, day, "Completed" if rng.random() < rate else "Not Completed") for day in dates)
+                if len(rows) >= chunk_size:
+                    count += flush(store, rows); rows = []
+            count += flush(store, rows)
+        store.rebuild_summary()
+    return count
+
+def flush(store, rows):
+    with store.transaction() as conn:
+        conn.executemany("INSERT OR REPLACE INTO habit_status (habit_id, date, status) VALUES (?, ?, ?)", rows)
+    return len(rows)
+
+# =============== BENCHMARKS ===============
+def cold(store):
+    # Drop in-process caches so a run measures the database work, as on first view.
+    store.invalidate_caches()
+    with store.transaction() as conn: conn.execute("UPDATE streak_cache SET as_of=NULL")
+
+def benchmarks(store, render, analytics_store=None):
+    # name -> fn, or (setup, fn) where setup runs untimed before every sample.
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    habit_id = store.scalar("SELECT MIN(id) FROM habits")
+    pie = bar = None
+    if render:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from charts import PieChart, BarChart
+        pie, bar = PieChart(), BarChart()
+        FigureCanvasAgg(pie.figure); FigureCanvasAgg(bar.figure)
+
+    def toggle():
+        if habit_id is None: return
+        store.toggle_status(habit_id, today); store.toggle_status(habit_id, today)  # net no-op
+
+    def draw_pie():
+        completed, total = store.day_summary(today)
+        if pie:
+            pie.values = None; pie.update([completed, total - completed if total else 0]); pie.figure.canvas.draw()
+
+    def draw_bar():
+        stats = store.home_stats(now)
+        if bar:
+            bar.values = None; bar.update(stats["week"], stats["week_labels"]); bar.figure.canvas.draw()
+
+    matrix = None
+    def analytics():
+        # Built on first use, on its own store, so its write listener never rides along with toggle_status.
+        nonlocal matrix
+        if matrix is None:
+            from analytics import CompletionMatrix
+            matrix = CompletionMatrix(analytics_store or store)
+        return matrix
+
+    return {
+        "load_today_habits": lambda: store.day_statuses(today),
+        "toggle_status": toggle,
+        "update_stats": lambda: store.home_stats(now),
+        "calculate_streak": lambda: store.streak(now),
+        "calculate_streak_cold": (lambda: cold(store), lambda: store.streak(now)),
+        "draw_pie_chart": draw_pie,
+        "draw_bar_chart": draw_bar,
+        "load_details_for_date": lambda: store.month_details(now.year, now.month),
+        "load_details_for_date_cold": (lambda: cold(store), lambda: store.month_details(now.year, now.month)),
+        "analytics_load": lambda: analytics().load(),
+        "analytics_summary": lambda: analytics().summary(),
+    }
+
+def run(db_path, repeat=20, warmup=2, render=False, only=None):
+    results = {}
+    with HabitStore(db_path) as store, HabitStore(db_path) as analytics_store:
+        meta = {"db": os.path.abspath(db_path), "habits": store.habit_count(),
+                "status_rows": store.scalar("SELECT COUNT(*) FROM habit_status"),
+                "days": store.scalar("SELECT COUNT(*) FROM daily_summary"), "repeat": repeat, "render": render,
+                "python": platform.python_version(), "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(), "timestamp": datetime.now().isoformat(timespec="seconds")}
+        for name, bench in benchmarks(store, render, analytics_store).items():
+            if only and name not in only: continue
+            setup, fn = bench if isinstance(bench, tuple) else (None, bench)
+            for _ in range(warmup):
+                if setup: setup()
+                fn()
+            samples = []
+            for _ in range(repeat):
+                if setup: setup()
+                started = time.perf_counter(); fn(); samples.append((time.perf_counter() - started) * 1000)
+            samples.sort()
+            results[name] = {"min_ms": samples[0], "median_ms": statistics.median(samples), "mean_ms": statistics.fmean(samples),
+                             "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))], "max_ms": samples[-1]}
+    return {"meta": meta, "results": results}
+
+def compare(current, previous, key="median_ms"):
+    lines = [f"{'benchmark':<28}{'previous':>12}{'current':>12}{'ratio':>8}"]
+    for name, stats in current["results"].items():
+        before = previous.get("results", {}).get(name)
+        if not before: lines.append(f"{name:<28}{'-':>12}{stats[key]:>12.3f}{'new':>8}"); continue
+        ratio = stats[key] / before[key] if before[key] else float("inf")
+        lines.append(f"{name:<28}{before[key]:>12.3f}{stats[key]:>12.3f}{ratio:>7.2f}x")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Habit tracker headless benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    gen = commands.add_parser("generate", help="write synthetic history into a database")
+    gen.add_argument("--db", required=True)
+    gen.add_argument("--habits", type=int, default=1000)
+    gen.add_argument("--years", type=float, default=1)
+    gen.add_argument("--density", type=float, default=0.6, help="mean completion rate per habit-day (0-1)")
+    gen.add_argument("--seed", type=int, default=0)
+    bench = commands.add_parser("run", help="time the hot paths and print JSON results")
+    bench.add_argument("--db", required=True)
+    bench.add_argument("--repeat", type=int, default=20)
+    bench.add_argument("--warmup", type=int, default=2)
+    bench.add_argument("--render", action="store_true", help="also render charts with the Agg backend")
+    bench.add_argument("--only", nargs="*", help="benchmark names to run")
+    bench.add_argument("--output", help="write results JSON here instead of stdout")
+    bench.add_argument("--compare", help="previous results JSON to compare medians against")
+    args = parser.parse_args()
+    if args.command == "generate":
+        started = time.perf_counter()
+        count = generate(args.db, args.habits, args.years, args.density, args.seed)
+        print(f"Generated {count} status rows in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    else:
+        current = run(args.db, args.repeat, args.warmup, args.render, args.only)
+        text = json.dumps(current, indent=2)
+        if args.output:
+            with open(args.output, "w") as out: out.write(text + "\n")
+        else: print(text)
+        if args.compare:
+            with open(args.compare) as previous: print(compare(current, json.load(previous)), file=sys.stderr)
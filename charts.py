@@ -0,0 +1,90 @@
+from math import cos, sin, radians
+from matplotlib.figure import Figure
+from matplotlib.patches import Wedge
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from profiler import PROFILER
+
+class Chart:
+    """A figure that is built once and redrawn in place; `mount` attaches it to a (new) Tk parent."""
+    def __init__(self, figsize):
+        self.figure = Figure(figsize=figsize)
+        self.ax = self.figure.add_subplot()
+        self.canvas, self.values, self.draw_action = None, None, None
+
+    def mount(self, parent):
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.canvas.draw = self.profiled(self.canvas.draw)
+        self.canvas.get_tk_widget().pack()
+        self.canvas.draw_idle()
+
+    def profiled(self, draw):
+        # draw_idle renders later from Tk's idle loop; attribute that render to the action that changed the data.
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled: return draw(*args, **kwargs)
+            with PROFILER.activate(self.draw_action), PROFILER.span(f"{type(self).__name__}.draw", "render"):
+                return draw(*args, **kwargs)
+        return wrapper
+
+    def update(self, values):
+        values = tuple(values)
+        if values == self.values: return False
+        self.values, self.draw_action = values, PROFILER.current()
+        self.apply(values)
+        if self.canvas: self.canvas.draw_idle()
+        return True
+
+    def apply(self, values): raise NotImplementedError
+
+class PieChart(Chart):
+    COLORS, EMPTY_COLOR = ("#53ba83", "#d03333"), "#cccccc"
+    LABELS = ("Completed", "Not Completed")
+
+    def __init__(self, figsize=(4, 2.2)):
+        super().__init__(figsize)
+        self.wedges = [Wedge((0, 0), 1, 90, 90, facecolor=color) for color in self.COLORS]
+        for wedge in self.wedges: self.ax.add_patch(wedge)
+        self.labels = [self.ax.text(0, 0, "", va="center") for _ in self.wedges]
+        self.pcts = [self.ax.text(0, 0, "", ha="center", va="center") for _ in self.wedges]
+        self.ax.set_xlim(-1.25, 1.25); self.ax.set_ylim(-1.25, 1.25)
+        self.ax.set_aspect("equal"); self.ax.axis("off")
+        self.figure.tight_layout()
+
+    def apply(self, values):
+        total = sum(values)
+        fractions, labels = ([v / total for v in values], self.LABELS) if total else ([1, 0], ("No Data", ""))
+        # Same geometry as ax.pie(startangle=90): counter-clockwise from 12 o'clock.
+        theta = 90
+        for i, (wedge, fraction) in enumerate(zip(self.wedges, fractions)):
+            wedge.set_theta1(theta); wedge.set_theta2(theta + 360 * fraction)
+            wedge.set_facecolor(self.COLORS[i] if total else self.EMPTY_COLOR)
+            wedge.set_visible(fraction > 0)
+            mid = wedge.theta1 + (wedge.theta2 - wedge.theta1) / 2
+            x, y = self.polar(mid, 1.1)
+            self.labels[i].set(text=labels[i], x=x, y=y, ha="left" if x > 0 else "right", visible=fraction > 0)
+            x, y = self.polar(mid, 0.6)
+            self.pcts[i].set(text=f"{fraction * 100:.0f}%", x=x, y=y, visible=bool(total and fraction))
+            theta += 360 * fraction
+
+    @staticmethod
+    def polar(angle, radius):
+        return radius * cos(radians(angle)), radius * sin(radians(angle))
+
+class BarChart(Chart):
+    def __init__(self, count=7, figsize=(3, 2.2), color="#28aed3"):
+        super().__init__(figsize)
+        self.bars = self.ax.bar(range(count), [0] * count, color=color)
+        self.ax.set_ylim(0, 100)
+        self.ax.set_xticks(range(count))
+        self.ax.set_xticklabels([""] * count, fontsize=9)
+        self.ax.set_ylabel("Completion (%)")
+        self.figure.tight_layout()
+        self.ticks = None
+
+    def apply(self, values):
+        heights, ticks = values
+        for bar, height in zip(self.bars, heights): bar.set_height(height)
+        if ticks != self.ticks:
+            self.ticks = ticks
+            self.ax.set_xticklabels(ticks, fontsize=9)
+
+    def update(self, heights, ticks): return super().update((tuple(heights), tuple(ticks)))
@@ -1,27 +1,27 @@
+import time
+STARTED = time.perf_counter()
 import tkinter as tk
-from tkinter import ttk, messagebox
-import sqlite3, calendar
-from datetime import datetime, timedelta
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-
-def init_profile_db():
-    with sqlite3.connect("habits.db") as conn:
-        conn.execute('''CREATE TABLE IF NOT EXISTS profile (
-            id INTEGER PRIMARY KEY, name TEXT, age INTEGER, height REAL, weight REAL, phone TEXT, address TEXT)''')
-
-def get_profile():
-    with sqlite3.connect("habits.db") as conn:
-        return conn.execute("SELECT name, age, height, weight, phone, address FROM profile WHERE id=1").fetchone()
-
-def save_profile(name, age, height, weight, phone, address):
-    with sqlite3.connect("habits.db") as conn:
-        conn.execute("INSERT OR REPLACE INTO profile (id, name, age, height, weight, phone, address) VALUES (1,?,?,?,?,?,?)",
-                     (name, age, height, weight, phone, address))
+from tkinter import ttk, messagebox, filedialog
+import calendar, os, sys
+from datetime import datetime
+from profiler import PROFILER
+from store import HabitStore, DEFAULT_DB_PATH
+from tasks import TkExecutor, RefreshScheduler
+from widgets import VirtualHabitList, CalendarGrid
+
+VIEW_CHANNELS = ("view", "stats", "month", "day", "prefetch")  # executor channels whose results belong to the mounted view
 
 class HabitTrackerApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, db_path=DEFAULT_DB_PATH):
         super().__init__()
+        self.store = HabitStore(db_path)
+        self.pie_chart = self.bar_chart = None  # built once the habit list is on screen; see show_habit_list
+        self.startup_times = {}
+        self.home_stats, self.stats_regions = None, set()
+        self.perf_overlay = self.perf_overlay_job = None
+        self.refresh = RefreshScheduler(self)
+        # One worker: the store serializes on a single connection, and FIFO order keeps writes ahead of later reads.
+        self.tasks = TkExecutor(self, max_workers=1, on_error=lambda e: messagebox.showerror("Database Error", str(e)))
         self.title("HABIT TRACKER APPLICATION")
         self.state('zoom')
         self.configure(bg="#e7f1fb")
@@ -38,16 +38,12 @@ class HabitTrackerApp(tk.Tk):
         style.configure("Nav.TFrame", background="#469ed0")
         style.configure("StatusCard.TFrame", background="white", relief="flat", borderwidth=0)
         style.configure("ProfileCard.TFrame", background="white", relief="raised", borderwidth=1)
-        self.init_db()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.create_widgets()
+        if PROFILER.enabled: self.set_profiling(True)
 
-    def init_db(self):
-        with sqlite3.connect("habits.db") as conn:
-            conn.execute('''CREATE TABLE IF NOT EXISTS habits (
-                id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL)''')
-            conn.execute('''CREATE TABLE IF NOT EXISTS habit_status (
-                id INTEGER PRIMARY KEY AUTOINCREMENT, habit_id INTEGER, date TEXT, status TEXT DEFAULT 'Not Completed')''')
-        init_profile_db()
+    def on_close(self):
+        self.tasks.shutdown(); self.store.close(); self.destroy()
 
     def create_widgets(self):
         nav_frame = ttk.Frame(self, style="Nav.TFrame", width=170)
@@ -59,6 +55,7 @@ class HabitTrackerApp(tk.Tk):
         self.main_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
         self.create_home()
 
+    @PROFILER.timed("build")
     def set_dark_mode(self, enabled):
         self.dark_mode = enabled
         bg, fg = ("#23272e", "#f1c40f") if enabled else ("#e7f1fb", "#469ed0")
@@ -88,12 +85,16 @@ class HabitTrackerApp(tk.Tk):
                 elif isinstance(child, tk.Canvas): child.configure(bg=card_bg)
                 elif isinstance(child, tk.Button): child.configure(bg=fg, fg="white", activebackground=label_fg)
                 deep_update(child)
-        deep_update(self.main_frame)
-        if self.profile_display_frame: deep_update(self.profile_display_frame)
+        with PROFILER.span("deep_update", "build"):
+            deep_update(self.main_frame)
+            if self.profile_display_frame: deep_update(self.profile_display_frame)
 
-    def clear_main_frame(self): [w.destroy() for w in self.main_frame.winfo_children()]
+    def clear_main_frame(self):
+        for channel in VIEW_CHANNELS: self.tasks.cancel(channel)  # drop the outgoing view's results; writes still complete
+        [w.destroy() for w in self.main_frame.winfo_children()]
 
     # =============== HOMEPAGE SECTION ===============
+    @PROFILER.timed("build")
     def create_home(self):
         self.clear_main_frame()
         top_frame = ttk.Frame(self.main_frame, style="Card.TFrame")
@@ -112,15 +113,9 @@ class HabitTrackerApp(tk.Tk):
         habit_card.grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=0)
         habit_card.pack_propagate(False); habit_card.config(width=600, height=550)
         tk.Label(habit_card, text="Today's Habits", font=("Segoe UI", 16, "bold"), bg="white", fg="#469ed0").pack(pady=12)
-        canvas = tk.Canvas(habit_card, bg="white", borderwidth=0, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(habit_card, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg="white")
-        scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((20, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        self.habit_buttons_frame = scroll_frame
+        self.habit_list = VirtualHabitList(habit_card, on_toggle=self.toggle_status, on_delete=self.delete_habit)
+        self.habit_list.pack(fill="both", expand=True)
+        self.refresh.register(("list", "row"), self.refresh_habit_list, self.habit_list)
         chart_card = ttk.Frame(middle_frame, style="Card.TFrame")
         chart_card.grid(row=0, column=1, sticky="nsew", padx=(10,0), pady=0)
         chart_card.pack_propagate(False)
@@ -139,7 +134,35 @@ class HabitTrackerApp(tk.Tk):
         self.completion_label = tk.Label(bottom_frame, text="📊 Success Rate: 0.0%", bg="white", font=("Montserrat", 22, "bold"),
             fg="#2d87f0", width=20, height=2, anchor="e", padx=30)
         self.completion_label.pack(side="right", padx=30, pady=10, expand=True, fill="both")
-        self.load_today_habits(); self.draw_pie_chart(); self.draw_bar_chart()
+        self.refresh.register(("stats", "pie", "bar"), self.refresh_home_stats, self.completion_label)
+        self.load_today_habits()
+        if self.pie_chart: self.mount_charts()
+        else:
+            for frame in (self.pie_canvas, self.bar_canvas):
+                tk.Label(frame, text="Loading chart...", bg="white", fg="#999", font=("Segoe UI", 11)).pack(expand=True)
+
+    @PROFILER.timed("render")
+    def load_charts(self):
+        # matplotlib is only imported once the habit list is on screen; it dominates cold-start time.
+        if not self.pie_chart:
+            from charts import PieChart, BarChart
+            self.pie_chart, self.bar_chart = PieChart(), BarChart()
+        if self.pie_canvas.winfo_exists(): self.mount_charts()
+        if "charts" not in self.startup_times:
+            self.startup_times["charts"] = time.perf_counter() - STARTED
+            if os.environ.get("HABIT_TRACKER_STARTUP_LOG"): print(self.startup_summary(), file=sys.stderr)
+
+    @PROFILER.timed("render")
+    def mount_charts(self):
+        for frame, chart in ((self.pie_canvas, self.pie_chart), (self.bar_canvas, self.bar_chart)):
+            [w.destroy() for w in frame.winfo_children()]
+            chart.mount(frame)
+        self.draw_pie_chart(); self.draw_bar_chart()
+
+    def startup_summary(self):
+        times = self.startup_times
+        if not times: return "Startup: measuring..."
+        return "Startup: " + ", ".join(f"{name.replace('_', ' ')} {seconds * 1000:.0f} ms" for name, seconds in times.items())
 
     def clear_placeholder(self, event):
         if self.placeholder_active:
@@ -152,104 +175,86 @@ class HabitTrackerApp(tk.Tk):
             self.habit_entry.config(foreground="gray")
             self.placeholder_active = True
 
+    @PROFILER.timed("build")
     def add_habit(self):
         habit = self.habit_entry.get().strip()
         if habit == "" or (self.placeholder_active and habit == self.placeholder_text):
             messagebox.showwarning("Input Needed", "Please enter a habit to add."); return
-        with sqlite3.connect("habits.db") as conn:
-            conn.execute("INSERT INTO habits (name) VALUES (?)", (habit,))
+        def done(habit_id):
+            self.habit_list.append(habit_id, habit); self.refresh.mark("stats", "pie", "bar", "calendar")
+        self.tasks.submit(self.store.add_habit, habit, on_done=done, channel="view", cancellable=False)
         self.habit_entry.delete(0, tk.END)
         self.restore_placeholder(None)
-        self.load_today_habits(); self.draw_pie_chart(); self.draw_bar_chart()
 
-    def load_today_habits(self):
-        [w.destroy() for w in self.habit_buttons_frame.winfo_children()]
-        today = datetime.now().strftime("%Y-%m-%d")
-        with sqlite3.connect("habits.db") as conn:
-            habits = conn.execute("SELECT id, name FROM habits").fetchall()
-            for habit_id, name in habits:
-                result = conn.execute("SELECT status FROM habit_status WHERE habit_id=? AND date=?", (habit_id, today)).fetchone()
-                status = result[0] if result else "Not Completed"
-                row = tk.Frame(self.habit_buttons_frame, bg="white")
-                row.pack(fill="x", pady=4, padx=3)
-                ttk.Button(row, text=name, width=24, style="TButton", command=lambda hid=habit_id: self.toggle_status(hid)).pack(side="left", padx=(0, 8))
-                tk.Label(row, text=status, bg="white",
-                    fg="#53ba83" if status == "Completed" else "#e74c3c", font=("Segoe UI", 11, "bold"), width=14, anchor="w").pack(side="left", padx=(5, 8))
-                ttk.Button(row, text="Delete", width=7, command=lambda hid=habit_id: self.delete_habit(hid)).pack(side="left", padx=(8, 8))
-        self.update_stats()
+    @PROFILER.timed("build")
+    def load_today_habits(self): self.refresh.mark("list", "stats", "pie", "bar")
 
+    @PROFILER.timed("build")
     def toggle_status(self, habit_id):
+        # Regions are marked when the write lands, so a burst of clicks settles into one refresh pass.
         today = datetime.now().strftime("%Y-%m-%d")
-        with sqlite3.connect("habits.db") as conn:
-            result = conn.execute("SELECT status FROM habit_status WHERE habit_id=? AND date=?", (habit_id, today)).fetchone()
-            if result:
-                new_status = "Completed" if result[0] != "Completed" else "Not Completed"
-                conn.execute("UPDATE habit_status SET status=? WHERE habit_id=? AND date=?", (new_status, habit_id, today))
-            else:
-                conn.execute("INSERT INTO habit_status (habit_id, date, status) VALUES (?, ?, ?)", (habit_id, today, "Completed"))
-        self.load_today_habits(); self.draw_pie_chart(); self.draw_bar_chart()
+        self.tasks.submit(self.store.toggle_status, habit_id, today, channel="view", cancellable=False,
+                          on_done=lambda status: self.refresh.mark("stats", "pie", "bar", "calendar", rows={habit_id: status}))
 
+    @PROFILER.timed("build")
     def delete_habit(self, habit_id):
         if messagebox.askyesno("Delete Habit", "Are you sure you want to delete this habit and all its data?"):
-            with sqlite3.connect("habits.db") as conn:
-                conn.execute("DELETE FROM habits WHERE id=?", (habit_id,))
-                conn.execute("DELETE FROM habit_status WHERE habit_id=?", (habit_id,))
-            self.load_today_habits(); self.draw_pie_chart(); self.draw_bar_chart()
+            def done(_):
+                self.habit_list.remove(habit_id); self.refresh.mark("stats", "pie", "bar", "calendar")
+            self.tasks.submit(self.store.delete_habit, habit_id, on_done=done, channel="view", cancellable=False)
 
-    def update_stats(self):
-        today = datetime.now().strftime("%Y-%m-%d")
-        with sqlite3.connect("habits.db") as conn:
-            total = conn.execute("SELECT COUNT(*) FROM habits").fetchone()[0]
-            completed = conn.execute("SELECT COUNT(*) FROM habit_status WHERE date=? AND status='Completed'", (today,)).fetchone()[0]
-        self.streak_label.config(text=f"🔥Daily Streak: {self.calculate_streak()}")
-        self.completion_label.config(text=f"📊 Success Rate: {(completed/total*100) if total else 0.0:.1f}%")
-
-    def calculate_streak(self):
-        with sqlite3.connect("habits.db") as conn:
-            habits_count = conn.execute("SELECT COUNT(*) FROM habits").fetchone()[0]
-            if not habits_count: return 0
-            streak, day = 0, datetime.now()
-            while True:
-                date_str = day.strftime("%Y-%m-%d")
-                completed = conn.execute("SELECT COUNT(*) FROM habit_status WHERE date=? AND status='Completed'", (date_str,)).fetchone()[0]
-                if completed == habits_count: streak += 1; day -= timedelta(days=1)
-                else: break
-        return streak
+    @PROFILER.timed("build")
+    def update_stats(self): self.refresh.mark("stats", "pie", "bar")
+
+    # =============== REFRESH REGIONS ===============
+    @PROFILER.timed("build")
+    def refresh_habit_list(self, regions, rows):
+        if "list" in regions:
+            today = datetime.now().strftime("%Y-%m-%d")
+            self.tasks.submit(self.store.day_statuses, today, on_done=self.show_habit_list, channel="view")
+        for habit_id, status in rows.items(): self.habit_list.update_status(habit_id, status)
+
+    def show_habit_list(self, rows):
+        self.habit_list.set_items(rows)
+        if not self.pie_chart:
+            # First delivery of the list: charts (and the matplotlib import) wait until it has been painted.
+            self.startup_times.setdefault("first_frame", time.perf_counter() - STARTED)
+            self.after_idle(self.load_charts)
+
+    @PROFILER.timed("build")
+    def refresh_home_stats(self, regions, rows):
+        # A newer pass supersedes a computation still queued; the one that runs redraws every region asked for since.
+        self.stats_regions |= regions
+        self.tasks.cancel("stats")
+        self.tasks.submit(self.compute_home_stats, on_done=self.show_home_stats, channel="stats")
 
+    # Worker thread only: streak() may take the database write lock to refresh a stale cached run.
+    def compute_home_stats(self): return self.store.home_stats(datetime.now())
+
+    @PROFILER.timed("render")
+    def show_home_stats(self, stats):
+        self.home_stats, regions, self.stats_regions = stats, self.stats_regions, set()
+        if "stats" in regions:
+            completed, total = stats["completed"], stats["total"]
+            self.streak_label.config(text=f"🔥Daily Streak: {stats['streak']}")
+            self.completion_label.config(text=f"📊 Success Rate: {(completed/total*100) if total else 0.0:.1f}%")
+        if "pie" in regions: self.draw_pie_chart()
+        if "bar" in regions: self.draw_bar_chart()
+
+    @PROFILER.timed("render")
     def draw_pie_chart(self):
-        [w.destroy() for w in self.pie_canvas.winfo_children()]
-        today = datetime.now().strftime("%Y-%m-%d")
-        with sqlite3.connect("habits.db") as conn:
-            total = conn.execute("SELECT COUNT(*) FROM habits").fetchone()[0]
-            completed = conn.execute("SELECT COUNT(*) FROM habit_status WHERE date=? AND status='Completed'", (today,)).fetchone()[0]
+        if not (self.pie_chart and self.home_stats): return
+        completed, total = self.home_stats["completed"], self.home_stats["total"]
         not_completed = total - completed if total else 0
-        values = [completed, not_completed]
-        fig, ax = plt.subplots(figsize=(4, 2.2))
-        if sum(values) > 0:
-            ax.pie(values, labels=["Completed", "Not Completed"], autopct="%1.0f%%", colors=["#53ba83", "#d03333"], startangle=90)
-        else:
-            ax.pie([1], labels=["No Data"], colors=["#cccccc"], startangle=90)
-        ax.axis("equal"); plt.tight_layout()
-        FigureCanvasTkAgg(fig, master=self.pie_canvas).get_tk_widget().pack()
-        plt.close(fig)
+        self.pie_chart.update([completed, not_completed])
 
+    @PROFILER.timed("render")
     def draw_bar_chart(self):
-        [w.destroy() for w in self.bar_canvas.winfo_children()]
-        today = datetime.now()
-        dates = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
-        with sqlite3.connect("habits.db") as conn:
-            total = conn.execute("SELECT COUNT(*) FROM habits").fetchone()[0]
-            completed_list = [(conn.execute("SELECT COUNT(*) FROM habit_status WHERE date=? AND status='Completed'", (d,)).fetchone()[0]/total*100) if total else 0 for d in dates]
-        fig, ax = plt.subplots(figsize=(3, 2.2))
-        ax.bar(range(7), completed_list, color="#28aed3")
-        ax.set_ylim(0, 100)
-        ax.set_xticks(range(7))
-        ax.set_xticklabels([(today - timedelta(days=i)).strftime("%a") for i in range(6, -1, -1)], fontsize=9)
-        ax.set_ylabel("Completion (%)"); plt.tight_layout()
-        FigureCanvasTkAgg(fig, master=self.bar_canvas).get_tk_widget().pack()
-        plt.close(fig)
+        if not (self.bar_chart and self.home_stats): return
+        self.bar_chart.update(self.home_stats["week"], self.home_stats["week_labels"])
 
     # =============== HABITS DETAILS SECTION ===============
+    @PROFILER.timed("build")
     def create_habits_details(self):
         self.clear_main_frame()
         detail_card = ttk.Frame(self.main_frame, style="Card.TFrame")
@@ -260,8 +265,9 @@ class HabitTrackerApp(tk.Tk):
         self.cal_month_label = tk.Label(cal_control_frame, text="", font=("Segoe UI", 14, "bold"), bg="white", fg="#2d87f0")
         self.cal_month_label.pack(side="left", padx=6)
         ttk.Button(cal_control_frame, text="▶", width=3, command=self.next_month).pack(side="left", padx=10)
-        self.cal_frame = tk.Frame(detail_card, bg="white"); self.cal_frame.pack()
-        self.draw_calendar(self.cal_frame, self.details_year, self.details_month)
+        self.calendar_grid = CalendarGrid(detail_card, on_select=self.load_details_for_date); self.calendar_grid.pack()
+        self.refresh.register("calendar", lambda regions, rows: self.refresh_calendar(), self.calendar_grid)
+        self.refresh_calendar()
         self.details_status_frame = tk.Frame(detail_card, bg="white")
         self.details_status_frame.pack(pady=20, fill="x", padx=10)
         now = datetime.now(); self.load_details_for_date(now.year, now.month, now.day)
@@ -274,39 +280,57 @@ class HabitTrackerApp(tk.Tk):
         self.details_year, self.details_month = (self.details_year + 1, 1) if self.details_month == 12 else (self.details_year, self.details_month + 1)
         self.refresh_calendar()
 
+    @PROFILER.timed("build")
     def refresh_calendar(self):
-        [w.destroy() for w in self.cal_frame.winfo_children()]
-        self.draw_calendar(self.cal_frame, self.details_year, self.details_month)
-        self.cal_month_label.config(text=f"{calendar.month_name[self.details_month]} {self.details_year}")
-
-    def draw_calendar(self, parent, year, month):
-        if hasattr(self, "cal_month_label"):
-            self.cal_month_label.config(text=f"{calendar.month_name[month]} {year}")
-        cal = calendar.monthcalendar(year, month)
-        days_frame = tk.Frame(parent, bg="white"); days_frame.pack()
-        [tk.Label(days_frame, text=day, font=("Segoe UI", 11, "bold"), bg="white", fg="#469ed0", width=8).grid(row=0, column=idx)
-            for idx, day in enumerate(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])]
-        for r, week in enumerate(cal):
-            for c, day in enumerate(week):
-                if day == 0:
-                    tk.Label(days_frame, text="", bg="white", width=6).grid(row=r+1, column=c)
-                else:
-                    ttk.Button(days_frame, text=str(day), width=7, command=lambda d=day: self.load_details_for_date(year, month, d)).grid(row=r+1, column=c, padx=4, pady=4)
+        year, month = self.details_year, self.details_month
+        self.cal_month_label.config(text=f"{calendar.month_name[month]} {year}")
+        self.tasks.cancel("month")
+        cached = self.store.peek_month(year, month)
+        if cached: self.show_month(year, month, cached)
+        else:
+            self.calendar_grid.show(year, month, {})
+            self.tasks.submit(self.store.month_details, year, month, on_done=lambda data: self.show_month(year, month, data), channel="month")
+        # Warm the neighbouring months so paging does not wait on the database.
+        for y, m in ((year - 1, 12) if month == 1 else (year, month - 1), (year + 1, 1) if month == 12 else (year, month + 1)):
+            if not self.store.peek_month(y, m): self.tasks.submit(self.store.month_details, y, m, channel="prefetch")
+
+    @PROFILER.timed("build")
+    def show_month(self, year, month, data):
+        if (year, month) != (self.details_year, self.details_month): return
+        habits, days = data
+        last_day = calendar.monthrange(year, month)[1]
+        today = datetime.now().strftime("%Y-%m-%d")
+        # Heat runs up to today; future days stay uncoloured.
+        heat = {day: len(days.get(day, ())) / len(habits) for day in range(1, last_day + 1)
+                if f"{year:04d}-{month:02d}-{day:02d}" <= today} if habits else {}
+        self.calendar_grid.show(year, month, heat)
 
+    @PROFILER.timed("build")
     def load_details_for_date(self, year, month, day):
-        [w.destroy() for w in self.details_status_frame.winfo_children()]
         date_str = f"{year:04d}-{month:02d}-{day:02d}"
-        with sqlite3.connect("habits.db") as conn:
-            habits = conn.execute("SELECT name, id FROM habits").fetchall()
-            tk.Label(self.details_status_frame, text=f"Habits on {date_str}:", font=("Segoe UI", 15, "bold"), bg="white", fg="#2d87f0").pack(anchor="w")
-            for name, hid in habits:
-                result = conn.execute("SELECT status FROM habit_status WHERE habit_id=? AND date=?", (hid, date_str)).fetchone()
-                status = result[0] if result else "Not Completed"
-                fg = "#53ba83" if status == "Completed" else "#e74c3c"
-                tk.Label(self.details_status_frame, text=f"  - {name}: {status}", bg="white", fg=fg, font=("Segoe UI", 12, "bold"), anchor="w", justify="left").pack(anchor="w")
+        self.tasks.cancel("day")  # only the most recently clicked day is shown
+        cached = self.store.peek_month(year, month)
+        if cached: self.show_details(date_str, self.details_rows(day, cached))
+        else:
+            self.tasks.submit(self.store.month_details, year, month,
+                              on_done=lambda data: self.show_details(date_str, self.details_rows(day, data)), channel="day")
+
+    def details_rows(self, day, data):
+        habits, days = data
+        completed = days.get(day, ())
+        return [(hid, name, "Completed" if hid in completed else "Not Completed") for hid, name in habits]
+
+    @PROFILER.timed("build")
+    def show_details(self, date_str, rows):
+        [w.destroy() for w in self.details_status_frame.winfo_children()]
+        tk.Label(self.details_status_frame, text=f"Habits on {date_str}:", font=("Segoe UI", 15, "bold"), bg="white", fg="#2d87f0").pack(anchor="w")
+        for hid, name, status in rows:
+            fg = "#53ba83" if status == "Completed" else "#e74c3c"
+            tk.Label(self.details_status_frame, text=f"  - {name}: {status}", bg="white", fg=fg, font=("Segoe UI", 12, "bold"), anchor="w", justify="left").pack(anchor="w")
 
     # =============== SETTINGS & PROFILE SECTION ===============
     def create_profile_section(self): self.create_settings_section()
+    @PROFILER.timed("build")
     def create_settings_section(self):
         self.clear_main_frame()
         card = ttk.Frame(self.main_frame, style="ProfileCard.TFrame")
@@ -314,33 +338,31 @@ class HabitTrackerApp(tk.Tk):
         profile_section = tk.LabelFrame(card, text="👤 Your Profile", bg="white", fg="#2d87f0", font=("Segoe UI", 17, "bold"),
             bd=2, relief="groove", padx=14, pady=10)
         profile_section.pack(fill="x", padx=10, pady=(0,30))
-        data = get_profile() or ["", "", "", "", "", ""]
         labels = ["Name:", "Age:", "Height (cm):", "Weight (kg):", "Phone Number:", "Address:"]
         self.profile_vars = []
         for i, label in enumerate(labels):
             tk.Label(profile_section, text=label, bg="white", font=("Segoe UI", 13, "bold"), anchor="e").grid(row=i, column=0, sticky="e", pady=6, padx=6)
-            var = tk.StringVar(value=str(data[i]) if data[i] is not None else "")
+            var = tk.StringVar(value="")
             ttk.Entry(profile_section, textvariable=var, width=28, font=("Segoe UI", 12)).grid(row=i, column=1, pady=6, padx=6, sticky="w")
             self.profile_vars.append(var)
         ttk.Button(profile_section, text="Save Profile", command=self.save_profile_action).grid(row=len(labels), column=0, columnspan=2, pady=12)
         if self.profile_display_frame: self.profile_display_frame.destroy()
         self.profile_display_frame = tk.Frame(card, bg="white"); self.profile_display_frame.pack(fill="x", padx=10)
-        profile = get_profile()
-        if profile and any(profile):
-            tk.Label(self.profile_display_frame, text="Profile Details:", font=("Segoe UI", 13, "bold"), anchor="w", bg="white", fg="#2d87f0").pack(anchor="w")
-            for i, label in enumerate(["Name", "Age", "Height (cm)", "Weight (kg)", "Phone", "Address"]):
-                value = profile[i] if profile and profile[i] is not None else ""
-                tk.Label(self.profile_display_frame, text=f"{label}: {value}", anchor="w", bg="white", font=("Segoe UI", 12)).pack(anchor="w")
+        self.tasks.submit(self.store.get_profile, on_done=lambda profile: self.show_profile(profile, fill=True), channel="view")
         ttk.Separator(card, orient="horizontal").pack(fill="x", pady=18)
         tk.Label(card, text="⚙️ Settings", font=("Segoe UI", 20, "bold"), bg="white", fg="#2d87f0").pack(anchor="w", pady=(0,8), padx=10)
         dark_var = tk.BooleanVar(value=self.dark_mode)
         ttk.Checkbutton(card, text="Enable Dark Mode", variable=dark_var, command=lambda: self.set_dark_mode(dark_var.get())).pack(anchor="w", pady=8, padx=14)
         def reset_habits():
             if messagebox.askyesno("Reset All Habits", "Are you sure you want to delete all habits and their statuses? This cannot be undone."):
-                with sqlite3.connect("habits.db") as conn:
-                    conn.execute("DELETE FROM habits"); conn.execute("DELETE FROM habit_status")
-                self.load_today_habits(); messagebox.showinfo("Reset Complete", "All habits have been deleted.")
+                def done(_):
+                    self.refresh.mark("list", "stats", "pie", "bar", "calendar")  # only views still mounted redraw
+                    messagebox.showinfo("Reset Complete", "All habits have been deleted.")
+                self.tasks.submit(self.store.reset, on_done=done, cancellable=False)
         ttk.Button(card, text="Reset All Habits", command=reset_habits).pack(anchor="w", pady=12, padx=14)
+        profile_var = tk.BooleanVar(value=PROFILER.enabled)
+        ttk.Checkbutton(card, text="Show Performance Overlay", variable=profile_var, command=lambda: self.set_profiling(profile_var.get())).pack(anchor="w", pady=8, padx=14)
+        ttk.Button(card, text="Export Performance Trace", command=self.export_trace).pack(anchor="w", pady=12, padx=14)
         ttk.Separator(card, orient="horizontal").pack(fill="x", pady=18)
         tk.Label(card, text="ℹ️ About Us", font=("Segoe UI", 20, "bold"), bg="white", fg="#2d87f0").pack(anchor="w", pady=(0, 10), padx=10)
         about_text = (
@@ -348,26 +370,62 @@ class HabitTrackerApp(tk.Tk):
             "Version 1.0\n\n"
             "This application helps you track, build, and maintain daily productive habits.\n"
             "Developed by Chirag Meher.\n\n"
-            "Contact: chiragmeher06@example.com\n"
+            "Contact: chiragmeher06@example.com\n\n"
+            f"{self.startup_summary()}\n"
         )
         tk.Label(card, text=about_text, bg="white", fg="#444", font=("Segoe UI", 13), justify="left").pack(anchor="w", padx=10)
 
+    # =============== PERFORMANCE OVERLAY ===============
+    def set_profiling(self, enabled):
+        PROFILER.enabled = enabled
+        if enabled and not self.perf_overlay:
+            self.perf_overlay = tk.Label(self, text="", bg="#23272e", fg="#f1c40f", font=("Consolas", 10), justify="left", anchor="w", padx=8, pady=4)
+            self.perf_overlay.place(relx=1.0, rely=1.0, x=-10, y=-10, anchor="se")
+            self.refresh_perf_overlay()
+        elif not enabled and self.perf_overlay:
+            self.after_cancel(self.perf_overlay_job)
+            self.perf_overlay.destroy(); self.perf_overlay = self.perf_overlay_job = None
+
+    def refresh_perf_overlay(self):
+        if not self.perf_overlay: return
+        recent = list(PROFILER.actions)[-5:]
+        self.perf_overlay.config(text="\n".join(str(action) for action in reversed(recent)) or "Profiling: waiting for an action...")
+        self.perf_overlay.lift()
+        self.perf_overlay_job = self.after(500, self.refresh_perf_overlay)
+
+    def export_trace(self):
+        path = filedialog.asksaveasfilename(title="Export Performance Trace", defaultextension=".json",
+                                            initialfile="habit-tracker-trace.json", filetypes=[("Chrome trace", "*.json")])
+        if not path: return
+        PROFILER.export(path)
+        messagebox.showinfo("Trace Exported", f"Saved {len(PROFILER.events)} events for {len(PROFILER.actions)} actions.\nOpen it in chrome://tracing or Perfetto.")
+
+    @PROFILER.timed("build")
+    def show_profile(self, profile, fill=False):
+        if fill:
+            for var, value in zip(self.profile_vars, profile or ()): var.set("" if value is None else str(value))
+        [w.destroy() for w in self.profile_display_frame.winfo_children()]
+        if profile and any(profile):
+            tk.Label(self.profile_display_frame, text="Profile Details:", font=("Segoe UI", 13, "bold"), anchor="w", bg="white", fg="#2d87f0").pack(anchor="w")
+            for i, label in enumerate(["Name", "Age", "Height (cm)", "Weight (kg)", "Phone", "Address"]):
+                value = profile[i] if profile[i] is not None else ""
+                tk.Label(self.profile_display_frame, text=f"{label}: {value}", anchor="w", bg="white", font=("Segoe UI", 12)).pack(anchor="w")
+
     def save_profile_action(self):
         vals = [v.get() for v in self.profile_vars]
-        try:
-            save_profile(vals[0], int(vals[1]), float(vals[2]), float(vals[3]), vals[4], vals[5])
+        invalid = lambda e: messagebox.showerror("Invalid Entry", "Please check your input values.\n" + str(e))
+        try: values = (vals[0], int(vals[1]), float(vals[2]), float(vals[3]), vals[4], vals[5])
+        except ValueError as e: invalid(e); return
+        def saved(profile):
             messagebox.showinfo("Profile Saved", "Your profile has been saved successfully!")
             [v.set("") for v in self.profile_vars]
-            if self.profile_display_frame:
-                [w.destroy() for w in self.profile_display_frame.winfo_children()]
-            profile = get_profile()
-            tk.Label(self.profile_display_frame, text="Profile Details:", font=("Segoe UI", 13, "bold"), anchor="w", bg="white", fg="#2d87f0").pack(anchor="w")
-            for i, label in enumerate(["Name", "Age", "Height (cm)", "Weight (kg)", "Phone", "Address"]):
-                value = profile[i] if profile and profile[i] is not None else ""
-                tk.Label(self.profile_display_frame, text=f"{label}: {value}", anchor="w", bg="white", font=("Segoe UI", 12)).pack(anchor="w")
+            self.show_profile(profile)
             if self.dark_mode: self.set_dark_mode(True)
-        except Exception as e:
-            messagebox.showerror("Invalid Entry", "Please check your input values.\n" + str(e))
+        self.tasks.submit(self.save_and_load_profile, values, on_done=saved, on_error=invalid, channel="view", cancellable=False)
+
+    def save_and_load_profile(self, values):  # worker thread
+        self.store.save_profile(*values)
+        return self.store.get_profile()
 
 if __name__ == "__main__":
     app = HabitTrackerApp()
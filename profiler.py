@@ -0,0 +1,118 @@
+import functools, json, os, sqlite3, threading, time
+from collections import deque
+from contextlib import contextmanager
+
+CATEGORIES = ("sql", "build", "render")
+
+class Action:
+    """Totals for one user action (a click, a navigation), including work it later triggers on the worker."""
+    def __init__(self, name):
+        self.name, self.started = name, time.perf_counter()
+        self.queries, self.totals = 0, dict.fromkeys(CATEGORIES, 0.0)
+
+    def as_dict(self):
+        return {"action": self.name, "queries": self.queries, **{f"{cat}_ms": round(sec * 1000, 3) for cat, sec in self.totals.items()}}
+
+    def __str__(self):
+        return (f"{self.name}: {self.queries} queries, sql {self.totals['sql'] * 1000:.1f} ms, "
+                f"build {self.totals['build'] * 1000:.1f} ms, render {self.totals['render'] * 1000:.1f} ms")
+
+class Profiler:
+    """Opt-in hot-path profiler; everything is a no-op apart from a flag check while disabled."""
+    def __init__(self, max_actions=200, max_events=100_000):
+        self.enabled = bool(os.environ.get("HABIT_TRACKER_PROFILE"))
+        self.actions, self.events = deque(maxlen=max_actions), deque(maxlen=max_events)
+        self.local, self.origin, self.pid = threading.local(), time.perf_counter(), os.getpid()
+        self.lock = threading.Lock()  # one Action is updated from both the Tk thread and the worker
+
+    def current(self): return getattr(self.local, "action", None)
+    def stack(self): return self.local.__dict__.setdefault("stack", [])
+
+    @contextmanager
+    def activate(self, action):
+        previous, self.local.action = self.current(), action
+        try: yield action
+        finally: self.local.action = previous
+
+    def record(self, name, category, started, seconds, exclusive=None, **args):
+        # Action totals use exclusive time so nested spans are not counted twice; the trace keeps full durations.
+        stack = self.stack()
+        if stack: stack[-1] += seconds
+        action = self.current()
+        if action is not None:
+            with self.lock:
+                action.totals[category] += seconds if exclusive is None else exclusive
+                if category == "sql" and args.get("query"): action.queries += 1
+        self.events.append({"name": name, "cat": category, "ph": "X", "pid": self.pid, "tid": threading.get_ident(),
+                            "ts": (started - self.origin) * 1e6, "dur": seconds * 1e6, "args": args})
+
+    @contextmanager
+    def span(self, name, category):
+        if not self.enabled: yield; return
+        action = self.current()
+        if action is None:
+            # An instrumented call with no action in flight is the start of a new user action.
+            action = Action(name); self.actions.append(action)
+        with self.activate(action):
+            stack = self.stack()
+            stack.append(0.0)
+            started = time.perf_counter()
+            try: yield
+            finally:
+                seconds = time.perf_counter() - started
+                self.record(name, category, started, seconds, exclusive=seconds - stack.pop())
+
+    def timed(self, category):
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled: return fn(*args, **kwargs)
+                with self.span(fn.__name__, category): return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def bind(self, fn):
+        # Carry the submitting action across threads and into later callbacks.
+        action = self.current()
+        if fn is None or action is None: return fn
+        def bound(*args, **kwargs):
+            with self.activate(action): return fn(*args, **kwargs)
+        return bound
+
+    def export(self, path):
+        # Chrome trace format (chrome://tracing, Perfetto); per-action totals ride along in otherData.
+        with open(path, "w", encoding="utf-8") as out:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms",
+                       "otherData": {"actions": [action.as_dict() for action in self.actions]}}, out)
+
+PROFILER = Profiler()
+
+# =============== SQLITE ===============
+class ProfiledCursor(sqlite3.Cursor):
+    def execute(self, sql, params=()):
+        if not PROFILER.enabled: return super().execute(sql, params)
+        started = time.perf_counter()
+        try: return super().execute(sql, params)
+        finally: PROFILER.record("execute", "sql", started, time.perf_counter() - started, query=" ".join(sql.split())[:200])
+
+    def executemany(self, sql, seq):
+        if not PROFILER.enabled: return super().executemany(sql, seq)
+        started = time.perf_counter()
+        try: return super().executemany(sql, seq)
+        finally: PROFILER.record("executemany", "sql", started, time.perf_counter() - started, query=" ".join(sql.split())[:200])
+
+    def fetch(self, method, *args):
+        if not PROFILER.enabled: return method(*args)
+        started = time.perf_counter()
+        try: return method(*args)
+        finally: PROFILER.record(method.__name__, "sql", started, time.perf_counter() - started)
+
+    def fetchone(self): return self.fetch(super().fetchone)
+    def fetchall(self): return self.fetch(super().fetchall)
+    def fetchmany(self, size=None): return self.fetch(super().fetchmany, size or self.arraysize)
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose execute()/executemany() go through ProfiledCursor so every statement can be timed."""
+    def cursor(self, factory=ProfiledCursor): return super().cursor(factory)
+    def execute(self, sql, params=()): return self.cursor().execute(sql, params)
+    def executemany(self, sql, seq): return self.cursor().executemany(sql, seq)
@@ -0,0 +1,307 @@
+import sqlite3, threading, json
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from profiler import ProfiledConnection
+
+DEFAULT_DB_PATH = "habits.db"
+MONTH_CACHE_SIZE = 24
+PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL", "PRAGMA foreign_keys=ON",
+           "PRAGMA temp_store=MEMORY", "PRAGMA cache_size=-16000", "PRAGMA busy_timeout=5000")
+
+# Recomputes daily_summary from habit_status; `total` is the current habit count since habits carry no history.
+REBUILD_SUMMARY = ("DELETE FROM daily_summary", "UPDATE streak_cache SET as_of=NULL",
+    '''INSERT INTO daily_summary (date, completed, total)
+        SELECT date, SUM(status = 'Completed'), (SELECT COUNT(*) FROM habits) FROM habit_status GROUP BY date''')
+
+# Secondary index that bulk loads drop and rebuild; re-asserted on open in case a load was interrupted.
+DATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_habit_status_date ON habit_status (date, status)"
+
+# Schema migrations, applied in order; PRAGMA user_version records how many have run.
+MIGRATIONS = [
+    # 1: original schema (IF NOT EXISTS so pre-migration databases are adopted as-is)
+    ('''CREATE TABLE IF NOT EXISTS habits (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL)''',
+     '''CREATE TABLE IF NOT EXISTS habit_status (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, habit_id INTEGER, date TEXT, status TEXT DEFAULT 'Not Completed')''',
+     '''CREATE TABLE IF NOT EXISTS profile (
+        id INTEGER PRIMARY KEY, name TEXT, age INTEGER, height REAL, weight REAL, phone TEXT, address TEXT)'''),
+    # 2: rebuild habit_status with a cascading foreign key, dropping orphans and keeping the newest duplicate row
+    ('''CREATE TABLE habit_status_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        habit_id INTEGER NOT NULL REFERENCES habits(id) ON DELETE CASCADE,
+        date TEXT NOT NULL, status TEXT DEFAULT 'Not Completed')''',
+     '''INSERT INTO habit_status_new (id, habit_id, date, status)
+        SELECT id, habit_id, date, status FROM habit_status
+        WHERE id IN (SELECT MAX(id) FROM habit_status GROUP BY habit_id, date)
+          AND habit_id IN (SELECT id FROM habits) AND date IS NOT NULL''',
+     "DROP TABLE habit_status",
+     "ALTER TABLE habit_status_new RENAME TO habit_status",
+     "CREATE UNIQUE INDEX idx_habit_status_habit_date ON habit_status (habit_id, date)",
+     DATE_INDEX),
+    # 3: per-day completion summary plus the cached length of the full-completion run before `as_of`
+    ('''CREATE TABLE daily_summary (
+        date TEXT PRIMARY KEY, completed INTEGER NOT NULL DEFAULT 0, total INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID''',
+     '''CREATE TABLE streak_cache (
+        id INTEGER PRIMARY KEY CHECK (id = 1), as_of TEXT, habits INTEGER, run_before INTEGER)''',
+     "INSERT INTO streak_cache (id) VALUES (1)") + REBUILD_SUMMARY,
+]
+
+def today(): return datetime.now().strftime("%Y-%m-%d")
+
+class LRUCache:
+    """Small thread-safe LRU map; its own lock so UI-thread peeks never wait on a running query."""
+    def __init__(self, capacity):
+        self.capacity, self.items, self.lock = capacity, OrderedDict(), threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.items: return None
+            self.items.move_to_end(key)
+            return self.items[key]
+
+    def put(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            while len(self.items) > self.capacity: self.items.popitem(last=False)
+
+    def discard(self, key):
+        with self.lock: self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock: self.items.clear()
+
+class HabitStore:
+    """Data layer for the habit tracker: one long-lived connection, no Tk dependency."""
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        # Autocommit mode so transactions are explicit; sqlite3 reuses compiled statements from its cache.
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False, cached_statements=256,
+                                    factory=ProfiledConnection)
+        self.lock = threading.RLock()
+        self._depth = 0
+        self.months = LRUCache(MONTH_CACHE_SIZE)  # (year, month) -> {day: frozenset(completed habit ids)}
+        self.habit_cache = None
+        self.listeners = []  # called as listener(event, *args) after each committed write
+        for pragma in PRAGMAS: self.conn.execute(pragma)
+        self.init_schema()
+
+    def close(self):
+        with self.lock: self.conn.close()
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            outer = self._depth == 0
+            if outer: self.conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self.conn
+            except BaseException:
+                self._depth -= 1
+                if outer: self.conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if outer: self.conn.execute("COMMIT")
+
+    @contextmanager
+    def without_date_index(self):
+        # For bulk loads: the (date, status) index is rebuilt once at the end instead of row by row.
+        with self.transaction() as conn: conn.execute("DROP INDEX IF EXISTS idx_habit_status_date")
+        try: yield
+        finally:
+            with self.transaction() as conn: conn.execute(DATE_INDEX)
+
+    def subscribe(self, listener): self.listeners.append(listener)
+    def notify(self, event, *args):
+        for listener in self.listeners: listener(event, *args)
+
+    def query(self, sql, params=()):
+        with self.lock: return self.conn.execute(sql, params).fetchall()
+    def scalar(self, sql, params=()):
+        with self.lock:
+            row = self.conn.execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    def schema_version(self): return self.scalar("PRAGMA user_version")
+
+    def init_schema(self):
+        with self.transaction() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for number, statements in enumerate(MIGRATIONS[version:], start=version + 1):
+                for sql in statements: conn.execute(sql)
+                conn.execute(f"PRAGMA user_version={number}")
+            conn.execute(DATE_INDEX)
+
+    # =============== HABITS ===============
+    def habits(self):
+        habits = self.habit_cache
+        if habits is None: habits = self.habit_cache = self.query("SELECT id, name FROM habits ORDER BY id")
+        return habits
+    def habit_count(self): return self.scalar("SELECT COUNT(*) FROM habits")
+
+    def add_habit(self, name):
+        with self.transaction() as conn:
+            habit_id = conn.execute("INSERT INTO habits (name) VALUES (?)", (name,)).lastrowid
+            self._habits_changed(conn)
+        self.habit_cache = None
+        self.notify("add", habit_id)
+        return habit_id
+
+    def delete_habit(self, habit_id):
+        with self.transaction() as conn:
+            conn.execute('''UPDATE daily_summary SET completed = completed - 1 WHERE date IN
+                (SELECT date FROM habit_status WHERE habit_id=? AND status='Completed')''', (habit_id,))
+            conn.execute("DELETE FROM habits WHERE id=?", (habit_id,))
+            self._habits_changed(conn)
+        self.invalidate_caches()
+        self.notify("delete", habit_id)
+
+    def reset(self):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM habits"); conn.execute("DELETE FROM daily_summary")
+            conn.execute("UPDATE streak_cache SET as_of=NULL")
+        self.invalidate_caches()
+        self.notify("reset")
+
+    def invalidate_caches(self):
+        self.habit_cache = None; self.months.clear()
+
+    def _habits_changed(self, conn):
+        # Every past day's "fully completed" flag depends on the habit count, so the cached run is invalid.
+        conn.execute("UPDATE daily_summary SET total=(SELECT COUNT(*) FROM habits) WHERE date >= ?", (today(),))
+        conn.execute("UPDATE streak_cache SET as_of=NULL")
+
+    # =============== STATUS ===============
+    def day_statuses(self, date):
+        return self.query('''SELECT h.id, h.name, COALESCE(s.status, 'Not Completed') FROM habits h
+            LEFT JOIN habit_status s ON s.habit_id = h.id AND s.date = ? ORDER BY h.id''', (date,))
+
+    def range_statuses(self, start, end, habit_ids=None):
+        # Returns {habit_id: {date: status}} for start <= date <= end; habits without rows are omitted.
+        sql = "SELECT habit_id, date, status FROM habit_status WHERE date BETWEEN ? AND ?"
+        params = (start, end)
+        if habit_ids is not None:
+            sql += " AND habit_id IN (SELECT value FROM json_each(?))"
+            params += (json.dumps(list(habit_ids)),)
+        result = {}
+        for habit_id, date, status in self.query(sql, params):
+            result.setdefault(habit_id, {})[date] = status
+        return result
+
+    # =============== MONTHS ===============
+    def month_completions(self, year, month):
+        days = self.months.get((year, month))
+        if days is None:
+            prefix = f"{year:04d}-{month:02d}"
+            rows = self.query('''SELECT CAST(substr(date, 9, 2) AS INTEGER), group_concat(habit_id) FROM habit_status
+                WHERE date BETWEEN ? AND ? AND status='Completed' GROUP BY date''', (prefix + "-01", prefix + "-31"))
+            days = {day: frozenset(map(int, ids.split(","))) for day, ids in rows}
+            self.months.put((year, month), days)
+        return days
+
+    def peek_month(self, year, month):
+        # Cache-only lookup for the UI thread: (habits, completions) or None if either needs a query.
+        days, habits = self.months.get((year, month)), self.habit_cache
+        return None if days is None or habits is None else (habits, days)
+
+    def month_details(self, year, month):
+        return self.habits(), self.month_completions(year, month)
+
+    # =============== SUMMARY ===============
+    def completed_counts(self, start, end):
+        return dict(self.query("SELECT date, completed FROM daily_summary WHERE date BETWEEN ? AND ?", (start, end)))
+
+    def day_summary(self, date):
+        row = self.query("SELECT completed, total FROM daily_summary WHERE date=?", (date,))
+        return row[0] if row else (0, self.habit_count())
+
+    def streak(self, day):
+        date_str = day.strftime("%Y-%m-%d")
+        with self.lock:
+            # A valid cache is served by one read; the write lock is only taken to refresh a stale run.
+            habits_count, as_of, cached_habits, run_before, completed = self.conn.execute('''SELECT
+                (SELECT COUNT(*) FROM habits), as_of, habits, run_before,
+                (SELECT completed FROM daily_summary WHERE date = ?) FROM streak_cache''', (date_str,)).fetchone()
+            if not habits_count: return 0
+            if as_of != date_str or cached_habits != habits_count:
+                with self.transaction() as conn:
+                    # Length of the unbroken run of fully completed days ending the day before `date_str`:
+                    # the n-th most recent full day is n days back exactly while the run is unbroken.
+                    run_before = conn.execute('''SELECT COUNT(*) FROM (
+                        SELECT julianday(?) - julianday(date) AS back, ROW_NUMBER() OVER (ORDER BY date DESC) AS rn
+                        FROM daily_summary WHERE date < ? AND completed = ?) WHERE back = rn''',
+                        (date_str, date_str, habits_count)).fetchone()[0]
+                    conn.execute("UPDATE streak_cache SET as_of=?, habits=?, run_before=?", (date_str, habits_count, run_before))
+        return run_before + 1 if completed == habits_count else 0
+
+    def home_stats(self, now):
+        # Everything the home dashboard shows besides the list: success rate, streak and the 7-day series.
+        completed, total = self.day_summary(now.strftime("%Y-%m-%d"))
+        days = [now - timedelta(days=i) for i in range(6, -1, -1)]
+        dates = [d.strftime("%Y-%m-%d") for d in days]
+        habits, counts = self.habit_count(), self.completed_counts(dates[0], dates[-1])
+        return {"completed": completed, "total": total, "streak": self.streak(now),
+                "week": [(counts.get(d, 0)/habits*100) if habits else 0 for d in dates], "week_labels": [d.strftime("%a") for d in days]}
+
+    def rebuild_summary(self):
+        with self.transaction() as conn:
+            for sql in REBUILD_SUMMARY: conn.execute(sql)
+        self.invalidate_caches()
+        self.notify("reload")  # history may have changed wholesale (import, recovery)
+
+    def toggle_status(self, habit_id, date):
+        with self.transaction() as conn:
+            status = conn.execute('''INSERT INTO habit_status (habit_id, date, status) VALUES (?, ?, 'Completed')
+                ON CONFLICT (habit_id, date) DO UPDATE
+                SET status = CASE WHEN status = 'Completed' THEN 'Not Completed' ELSE 'Completed' END
+                RETURNING status''', (habit_id, date)).fetchone()[0]
+            delta = 1 if status == "Completed" else -1
+            conn.execute('''INSERT INTO daily_summary (date, completed, total) VALUES (?, ?, (SELECT COUNT(*) FROM habits))
+                ON CONFLICT (date) DO UPDATE SET completed = completed + ?, total = excluded.total''', (date, max(delta, 0), delta))
+            # Toggling the cached day itself leaves the run before it intact; any other day may break or extend it.
+            conn.execute("UPDATE streak_cache SET as_of=NULL WHERE as_of IS NOT ?", (date,))
+        self.months.discard((int(date[:4]), int(date[5:7])))
+        self.notify("toggle", habit_id, date, status)
+        return status
+
+    # =============== PROFILE ===============
+    def get_profile(self):
+        with self.lock:
+            return self.conn.execute("SELECT name, age, height, weight, phone, address FROM profile WHERE id=1").fetchone()
+
+    def save_profile(self, name, age, height, weight, phone, address):
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO profile (id, name, age, height, weight, phone, address) VALUES (1,?,?,?,?,?,?)",
+                         (name, age, height, weight, phone, address))
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Habit tracker database maintenance")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("rebuild-summary", help="recompute daily_summary and the streak cache from habit_status")
+    for name, help_text in (("export", "stream habits and their history to a CSV or JSON Lines file"),
+                            ("import", "bulk-load habit history from a CSV or JSON Lines file")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("path", help="file path, or - for stdin/stdout")
+        command.add_argument("--format", choices=["csv", "jsonl"], help="defaults to the file extension (.csv, otherwise jsonl)")
+        command.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+    with HabitStore(args.db) as store:
+        if args.command == "rebuild-summary":
+            store.rebuild_summary(); print(f"Rebuilt summary for {store.scalar('SELECT COUNT(*) FROM daily_summary')} days")
+        elif args.command in ("export", "import"):
+            import sys, time, transfer
+            fmt, started = transfer.detect_format(args.path, args.format), time.perf_counter()
+            if args.command == "export":
+                out = sys.stdout if args.path == "-" else open(args.path, "w", newline="", encoding="utf-8")
+                with out: transfer.report("Exported", transfer.export_history(args.db, out, fmt, args.chunk_size), started)
+            else:
+                source = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")
+                with source:
+                    count, skipped = transfer.import_history(store, transfer.read_records(source, fmt), args.chunk_size)
+                transfer.report("Imported", count, started, skipped)
@@ -0,0 +1,102 @@
+import queue, sys
+from concurrent.futures import ThreadPoolExecutor
+from profiler import PROFILER
+
+class TkExecutor:
+    """Runs callables on a thread pool and delivers their results on the Tk thread.
+
+    Workers never touch Tk: finished results are queued and drained by an after() poll on the
+    main thread. Tasks submitted on a channel can be cancelled together (e.g. when a view is
+    replaced); their pending futures are cancelled and late results are dropped.
+    """
+    POLL_MS = 15
+
+    def __init__(self, root, max_workers=1, on_error=None):
+        self.root, self.on_error = root, on_error
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="habit-worker")
+        self.results = queue.SimpleQueue()
+        self.generations, self.futures = {}, {}
+        self.pending, self.polling = 0, False
+
+    def submit(self, fn, *args, on_done=None, on_error=None, channel=None, cancellable=True):
+        # cancellable=False is for writes: cancelling the channel still drops the callback, but the write runs.
+        generation = self.generations.get(channel, 0)
+        fn, on_done, on_error = PROFILER.bind(fn), PROFILER.bind(on_done), PROFILER.bind(on_error)
+        future = self.pool.submit(fn, *args)
+        self.pending += 1
+        if cancellable: self.futures.setdefault(channel, set()).add(future)
+        future.add_done_callback(lambda f: self.results.put((f, channel, generation, on_done, on_error)))
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.POLL_MS, self.poll)
+        return future
+
+    def cancel(self, channel):
+        self.generations[channel] = self.generations.get(channel, 0) + 1
+        for future in self.futures.pop(channel, ()): future.cancel()
+
+    def poll(self):
+        try:
+            while True:
+                try: future, channel, generation, on_done, on_error = self.results.get_nowait()
+                except queue.Empty: break
+                self.pending -= 1
+                self.futures.get(channel, set()).discard(future)
+                if future.cancelled() or generation != self.generations.get(channel, 0): continue
+                error = future.exception()
+                if error is None:
+                    if on_done is None: continue
+                    try: on_done(future.result()); continue
+                    except Exception as callback_error: error = callback_error
+                self.fail(error, on_error)
+        finally:
+            # Always reschedule: a failing callback must not stop later results from being delivered.
+            if self.pending: self.root.after(self.POLL_MS, self.poll)
+            else: self.polling = False
+
+    def fail(self, error, on_error):
+        handler = on_error or self.on_error
+        try:
+            if handler is None: raise error
+            handler(error)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def shutdown(self, wait=True):
+        for channel in list(self.futures): self.cancel(channel)
+        self.pool.shutdown(wait=wait)
+
+class RefreshScheduler:
+    """Collects dirty UI regions and redraws them in one after_idle pass.
+
+    Views register a handler per region together with a widget that marks the view as mounted;
+    a flush calls each mounted handler once with the subset of its regions that changed (and any
+    per-row updates), and silently drops regions whose view has been torn down.
+    """
+    REGIONS = ("list", "row", "stats", "pie", "bar", "calendar")
+
+    def __init__(self, root):
+        self.root, self.handlers = root, {}
+        self.dirty, self.rows, self.scheduled = set(), {}, False
+
+    def register(self, regions, handler, widget=None):
+        for region in (regions,) if isinstance(regions, str) else regions: self.handlers[region] = (handler, widget)
+
+    def mark(self, *regions, rows=None):
+        self.dirty.update(regions)
+        if rows: self.rows.update(rows); self.dirty.add("row")
+        if not self.scheduled:
+            self.scheduled = True
+            self.root.after_idle(PROFILER.bind(self.flush))  # the pass is attributed to the action that opened it
+
+    def flush(self):
+        dirty, rows = self.dirty, self.rows
+        self.dirty, self.rows, self.scheduled = set(), {}, False
+        calls = {}
+        for region in self.REGIONS:
+            if region not in dirty or region not in self.handlers: continue
+            handler, widget = self.handlers[region]
+            if widget is not None and not widget.winfo_exists():
+                del self.handlers[region]; continue
+            calls.setdefault(handler, set()).add(region)
+        for handler, regions in calls.items(): handler(regions, rows)
@@ -0,0 +1,60 @@
+import random
+from datetime import date, timedelta
+import pytest
+from analytics import CompletionMatrix
+from store import HabitStore
+
+TODAY = date.today()
+DAYS = [TODAY - timedelta(days=i) for i in range(20)]
+
+def completed(store):
+    return {(habit_id, date.fromisoformat(day)) for habit_id, day in
+            store.query("SELECT habit_id, date FROM habit_status WHERE status='Completed'")}
+
+def brute_force(store, as_of, windows):
+    done, habit_ids = completed(store), [hid for hid, _ in store.habits()]
+    streaks = {}
+    for habit_id in habit_ids:
+        day, streaks[habit_id] = as_of, 0
+        while (habit_id, day) in done: streaks[habit_id] += 1; day -= timedelta(days=1)
+    rates = {window: {habit_id: sum((habit_id, as_of - timedelta(days=i)) in done for i in range(window)) / window
+                      for habit_id in habit_ids} for window in windows}
+    return streaks, rates
+
+def test_patched_matrix_matches_brute_force(tmp_path):
+    rng = random.Random(12)
+    store = HabitStore(str(tmp_path / "habits.db"))
+    matrix = CompletionMatrix(store)  # empty store: starts today, so older toggles prepend columns
+    habit_ids = [store.add_habit(f"Habit {i}") for i in range(3)]
+    windows = (1, 7, 30)
+    for step in range(800):
+        roll = rng.random()
+        if roll < 0.03 or not habit_ids: habit_ids.append(store.add_habit(f"Habit {step}"))
+        elif roll < 0.05: store.delete_habit(habit_ids.pop(rng.randrange(len(habit_ids))))
+        else: store.toggle_status(rng.choice(habit_ids), rng.choice(DAYS[:5] if roll < 0.6 else DAYS).isoformat())
+        as_of = rng.choice(DAYS[:8])
+        streaks, rates = brute_force(store, as_of, windows)
+        assert matrix.overall_streak(as_of) == store.streak(as_of), f"step {step}"
+        assert matrix.streaks(as_of) == streaks, f"step {step}"
+        got = matrix.rates(windows, as_of)
+        assert all(got[w] == pytest.approx(rates[w]) for w in windows), f"step {step}"
+    fresh = CompletionMatrix(store)
+    assert fresh.streaks() == matrix.streaks() and fresh.rates() == matrix.rates()
+    store.close()
+
+def test_weekday_rates_and_ranking(tmp_path):
+    start = TODAY - timedelta(days=13)  # two full weeks, so each weekday covers exactly two days
+    with HabitStore(str(tmp_path / "habits.db")) as store:
+        daily, weekly, idle = store.add_habit("Daily"), store.add_habit("Weekly"), store.add_habit("Idle")
+        for i in range(14):
+            day = start + timedelta(days=i)
+            store.toggle_status(daily, day.isoformat())
+            if day.weekday() == 0: store.toggle_status(weekly, day.isoformat())
+        matrix = CompletionMatrix(store, start=start)
+        rates = matrix.weekday_rates()
+        assert rates[daily] == [1.0] * 7
+        assert rates[weekly] == [1.0] + [0.0] * 6
+        assert rates[idle] == [0.0] * 7
+        best, worst = matrix.ranked(window=14, count=2)
+        assert best == [daily, weekly] and worst == [idle, weekly]
+        assert matrix.summary()["overall_streak"] == 0
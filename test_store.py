@@ -0,0 +1,70 @@
+import random, sqlite3
+from datetime import date, timedelta
+from store import HabitStore
+
+START = date(2026, 1, 1)
+DAYS = [(START + timedelta(days=i)).isoformat() for i in range(12)]
+
+def completed_counts(store):
+    return dict(store.query("SELECT date, completed FROM daily_summary WHERE completed > 0"))
+
+def brute_force_streak(store, day):
+    # Walk back from `day` while every current habit has a Completed row, straight from habit_status.
+    habits = {hid for hid, _ in store.habits()}
+    done = {}
+    for habit_id, day_str in store.query("SELECT habit_id, date FROM habit_status WHERE status='Completed'"):
+        done.setdefault(day_str, set()).add(habit_id)
+    streak = 0
+    while habits and done.get(day.isoformat(), set()) >= habits:
+        streak, day = streak + 1, day - timedelta(days=1)
+    return streak
+
+def test_incremental_summary_matches_rebuild(tmp_path):
+    rng = random.Random(4)
+    store, rebuilt = HabitStore(str(tmp_path / "live.db")), HabitStore(str(tmp_path / "rebuilt.db"))
+    habit_ids = [store.add_habit(f"Habit {i}") for i in range(3)]
+    for step in range(2000):
+        roll = rng.random()
+        if roll < 0.03 or not habit_ids: habit_ids.append(store.add_habit(f"Habit {step}"))
+        elif roll < 0.05: store.delete_habit(habit_ids.pop(rng.randrange(len(habit_ids))))
+        else:
+            # Toggles cluster on a few days so full-completion runs actually form and break.
+            store.toggle_status(rng.choice(habit_ids), rng.choice(DAYS[-4:] if roll < 0.6 else DAYS))
+        for offset in (0, rng.randrange(len(DAYS))):
+            day = START + timedelta(days=len(DAYS) - 1 - offset)
+            assert store.streak(day) == brute_force_streak(store, day), f"step {step}, {day}"
+        if step % 100 == 0:
+            store.conn.backup(rebuilt.conn)
+            rebuilt.rebuild_summary()
+            assert completed_counts(store) == completed_counts(rebuilt), f"step {step}"
+    store.close(); rebuilt.close()
+
+def test_cached_streak_does_not_take_the_write_lock(tmp_path):
+    store = HabitStore(str(tmp_path / "habits.db"))
+    habit_id = store.add_habit("Read")
+    for day in DAYS: store.toggle_status(habit_id, day)
+    last = date.fromisoformat(DAYS[-1])
+    assert store.streak(last) == len(DAYS)
+    writer = sqlite3.connect(store.path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    store.conn.execute("PRAGMA busy_timeout=0")  # a write attempt now fails instead of waiting
+    assert store.streak(last) == len(DAYS)
+    writer.execute("ROLLBACK"); writer.close(); store.close()
+
+def test_date_index_is_restored_on_open(tmp_path):
+    # An interrupted bulk load can leave the index dropped; the next open puts it back.
+    path = str(tmp_path / "habits.db")
+    with HabitStore(path) as store: store.conn.execute("DROP INDEX idx_habit_status_date")
+    with HabitStore(path) as store:
+        assert store.scalar("SELECT name FROM sqlite_master WHERE name='idx_habit_status_date'")
+
+def test_range_statuses(tmp_path):
+    with HabitStore(str(tmp_path / "habits.db")) as store:
+        read, run, idle = store.add_habit("Read"), store.add_habit("Run"), store.add_habit("Idle")
+        for habit_id, day in ((read, DAYS[0]), (read, DAYS[1]), (run, DAYS[1]), (run, DAYS[1]), (run, DAYS[5])):
+            store.toggle_status(habit_id, day)
+        assert store.range_statuses(DAYS[0], DAYS[2]) == {
+            read: {DAYS[0]: "Completed", DAYS[1]: "Completed"}, run: {DAYS[1]: "Not Completed"}}
+        assert store.range_statuses(DAYS[1], DAYS[5], habit_ids=[run, idle]) == {
+            run: {DAYS[1]: "Not Completed", DAYS[5]: "Completed"}}
+        assert store.range_statuses(DAYS[0], DAYS[-1], habit_ids=[]) == {}
@@ -0,0 +1,70 @@
+import io
+import pytest
+import transfer
+from store import HabitStore
+
+def history(store):
+    # Habits as (name, their statuses), so same-named habits are compared without relying on ids.
+    rows = {}
+    for habit_id, name in store.habits(): rows[habit_id] = (name, [])
+    for habit_id, day, status in store.query("SELECT habit_id, date, status FROM habit_status ORDER BY date"):
+        rows[habit_id][1].append((day, status))
+    return sorted((name, tuple(statuses)) for name, statuses in rows.values())
+
+def round_trip(store, target, fmt):
+    out = io.StringIO()
+    exported = transfer.export_history(store.path, out, fmt)
+    out.seek(0)
+    return exported, transfer.import_history(target, transfer.read_records(out, fmt))
+
+@pytest.fixture
+def store(tmp_path):
+    store = HabitStore(str(tmp_path / "habits.db"))
+    read, run = store.add_habit("Read"), store.add_habit("Run")
+    store.add_habit("Stretch")  # no history: exported as a row with an empty date
+    for day in ("2026-10-01", "2026-10-02", "2026-10-03"): store.toggle_status(read, day)
+    store.toggle_status(run, "2026-10-02"); store.toggle_status(run, "2026-10-02")
+    yield store
+    store.close()
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_round_trip_into_fresh_and_same_db(store, tmp_path, fmt):
+    expected = history(store)
+    with HabitStore(str(tmp_path / f"fresh.{fmt}.db")) as fresh:
+        assert round_trip(store, fresh, fmt) == (5, (4, 0))
+        assert history(fresh) == expected
+        assert fresh.day_summary("2026-10-02") == (1, 3)
+    assert round_trip(store, store, fmt) == (5, (4, 0))
+    assert store.habit_count() == 3 and history(store) == expected
+
+def test_same_named_habits_stay_separate(store, tmp_path):
+    first, second = store.add_habit("Read"), store.add_habit("Read")
+    store.toggle_status(first, "2026-10-05")
+    store.toggle_status(second, "2026-10-05"); store.toggle_status(second, "2026-10-05")
+    expected = history(store)
+    with HabitStore(str(tmp_path / "fresh.db")) as fresh:
+        round_trip(store, fresh, "jsonl")
+        assert fresh.habit_count() == 5 and history(fresh) == expected
+    round_trip(store, store, "jsonl")
+    assert store.habit_count() == 5 and history(store) == expected
+
+def test_malformed_records_are_skipped_and_counted(tmp_path):
+    lines = ['{"habit_id": 1, "habit": "Read", "date": "2026/10/01", "status": "Completed"}',
+             '{"habit_id": 1, "habit": "Read", "date": "2026-10-02", "status": "done"}',
+             '{"habit_id": "x", "habit": "Run", "date": "2026-10-02"}',
+             '{"habit_id": 9, "date": "2026-10-03", "status": "Completed"}',
+             '{"habit": "", "date": "2026-10-03"}',
+             'not json', '[1, 2]',
+             '{"habit": "Walk", "date": "2026-10-04", "status": "no"}']
+    with HabitStore(str(tmp_path / "habits.db")) as store:
+        assert transfer.import_history(store, transfer.read_records(io.StringIO("\n".join(lines)))) == (2, 6)
+        assert history(store) == [("Read", (("2026-10-02", "Completed"),)), ("Walk", (("2026-10-04", "Not Completed"),))]
+        assert store.scalar("SELECT name FROM sqlite_master WHERE name='idx_habit_status_date'")
+
+def test_export_path_with_uri_characters(tmp_path):
+    path = tmp_path / "we#ird?" / "habits.db"
+    path.parent.mkdir()
+    with HabitStore(str(path)) as store: store.add_habit("Read")
+    out = io.StringIO()
+    assert transfer.export_history(str(path), out, "jsonl") == 1
+    assert not (tmp_path / "we").exists()
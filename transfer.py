@@ -0,0 +1,109 @@
+import csv, json, sqlite3, sys, time
+from datetime import date
+from itertools import islice
+from pathlib import Path
+
+FIELDS = ["habit_id", "habit", "date", "status"]
+CHUNK_SIZE = 50_000
+COMPLETED_VALUES = {"completed", "1", "true", "yes", "done", "x"}
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)): yield chunk
+
+def detect_format(path, fmt=None):
+    if fmt: return fmt
+    return "csv" if str(path).lower().endswith(".csv") else "jsonl"
+
+# =============== EXPORT ===============
+def iter_history(db_path, chunk_size=CHUNK_SIZE):
+    """Yield every habit/status pair as a dict; habits without history yield one row with an empty date."""
+    # Own read-only connection: WAL lets the export stream while the app keeps writing.
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        cursor = conn.execute('''SELECT h.id, h.name, s.date, s.status FROM habits h
+            LEFT JOIN habit_status s ON s.habit_id = h.id ORDER BY h.id, s.date''')
+        while rows := cursor.fetchmany(chunk_size):
+            for habit_id, name, day, status in rows:
+                yield {"habit_id": habit_id, "habit": name, "date": day or "", "status": status or ""}
+    finally:
+        conn.close()
+
+def export_history(db_path, out, fmt="jsonl", chunk_size=CHUNK_SIZE):
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        for chunk in chunked(iter_history(db_path, chunk_size), chunk_size):
+            writer.writerows(chunk); count += len(chunk)
+    else:
+        for chunk in chunked(iter_history(db_path, chunk_size), chunk_size):
+            out.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in chunk)); count += len(chunk)
+    return count
+
+# =============== IMPORT ===============
+def read_records(source, fmt="jsonl"):
+    if fmt == "csv": yield from csv.DictReader(source)
+    else:
+        for line in source:
+            if not line.strip(): continue
+            try: yield json.loads(line)
+            except json.JSONDecodeError: yield None  # counted as skipped by import_history
+
+def normalize_status(value):
+    return "Completed" if str(value or "").strip().lower() in COMPLETED_VALUES else "Not Completed"
+
+def parse_record(record):
+    """Validate one record as (exported habit id or None, name, ISO date or None, status); raises ValueError."""
+    if not isinstance(record, dict): raise ValueError("record is not an object")
+    name, habit_id, day = str(record.get("habit") or "").strip(), record.get("habit_id"), record.get("date")
+    try: habit_id = int(habit_id) if habit_id not in (None, "") else None
+    except (TypeError, ValueError): raise ValueError(f"bad habit_id {habit_id!r}") from None
+    if habit_id is None and not name: raise ValueError("record names no habit")
+    return habit_id, name, date.fromisoformat(str(day)).isoformat() if day else None, normalize_status(record.get("status"))
+
+def import_history(store, records, chunk_size=CHUNK_SIZE):
+    """Load records into the store; returns (rows imported, records skipped as malformed).
+
+    Records are keyed by their exported habit_id so same-named habits stay apart: each exported id
+    takes over one not-yet-claimed existing habit of that name, otherwise a new habit. Records
+    without an id fall back to matching by name.
+    """
+    unclaimed, by_name, by_export = {}, {}, {}
+    for hid, name in store.habits():
+        unclaimed.setdefault(name, []).append(hid); by_name.setdefault(name, hid)
+
+    def habit_for(conn, habit_id, name):
+        if habit_id in by_export: return by_export[habit_id]
+        if habit_id is None and name in by_name: return by_name[name]
+        if not name: raise ValueError(f"habit_id {habit_id} first appears without a name")
+        free = unclaimed.get(name) if habit_id is not None else None
+        hid = free.pop(0) if free else conn.execute("INSERT INTO habits (name) VALUES (?)", (name,)).lastrowid
+        if habit_id is None: by_name[name] = hid
+        else: by_export[habit_id] = hid
+        return hid
+
+    count = skipped = 0
+    try:
+        with store.without_date_index():
+            for chunk in chunked(records, chunk_size):
+                rows = []
+                with store.transaction() as conn:
+                    for record in chunk:
+                        try:
+                            habit_id, name, day, status = parse_record(record)
+                            hid = habit_for(conn, habit_id, name)
+                        except ValueError:
+                            skipped += 1; continue
+                        if day: rows.append((hid, day, status))
+                    conn.executemany('''INSERT INTO habit_status (habit_id, date, status) VALUES (?, ?, ?)
+                        ON CONFLICT (habit_id, date) DO UPDATE SET status = excluded.status''', rows)
+                count += len(rows)
+    finally:
+        store.rebuild_summary()
+    return count, skipped
+
+def report(verb, count, started, skipped=0):
+    elapsed = time.perf_counter() - started
+    print(f"{verb} {count} rows in {elapsed:.2f}s ({count / elapsed if elapsed else 0:,.0f} rows/s)", file=sys.stderr)
+    if skipped: print(f"Skipped {skipped} malformed records", file=sys.stderr)
@@ -0,0 +1,126 @@
+import tkinter as tk, calendar
+from tkinter import ttk
+
+STATUS_COLORS = {"Completed": "#53ba83"}
+NOT_COMPLETED_COLOR = "#e74c3c"
+
+class VirtualHabitList(tk.Frame):
+    """Scrollable habit list that only builds widgets for the rows currently in view and recycles them."""
+    ROW_HEIGHT = 44
+    PARKED_Y = -2 * ROW_HEIGHT  # spare slots sit above the scroll region, out of view
+
+    def __init__(self, parent, on_toggle, on_delete, **kwargs):
+        super().__init__(parent, bg="white", **kwargs)
+        self.on_toggle, self.on_delete = on_toggle, on_delete
+        self.items, self.positions, self.slots = [], {}, []
+        self.canvas = tk.Canvas(self, bg="white", borderwidth=0, highlightthickness=0, yscrollincrement=1)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", lambda e: self.render())
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(seq, self.on_mousewheel)
+
+    # =============== DATA ===============
+    def set_items(self, items):
+        self.items = [list(item) for item in items]
+        self.positions = {item[0]: i for i, item in enumerate(self.items)}
+        self.render()
+
+    def append(self, habit_id, name, status="Not Completed"):
+        self.positions[habit_id] = len(self.items)
+        self.items.append([habit_id, name, status])
+        self.render()
+
+    def remove(self, habit_id):
+        index = self.positions.pop(habit_id, None)
+        if index is None: return
+        del self.items[index]
+        for i in range(index, len(self.items)): self.positions[self.items[i][0]] = i
+        self.render()
+
+    def update_status(self, habit_id, status):
+        index = self.positions.get(habit_id)
+        if index is None: return
+        self.items[index][2] = status
+        for slot in self.slots:
+            if slot.habit_id == habit_id: self.fill_slot(slot, self.items[index])
+
+    # =============== VIEW ===============
+    def yview(self, *args):
+        self.canvas.yview(*args); self.render()
+
+    def on_mousewheel(self, event):
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self.yview("scroll", step * self.ROW_HEIGHT, "units")
+        return "break"
+
+    def make_slot(self):
+        slot = tk.Frame(self.canvas, bg="white")
+        slot.habit_id = None
+        slot.name_button = ttk.Button(slot, width=24, style="TButton", command=lambda: self.on_toggle(slot.habit_id))
+        slot.name_button.pack(side="left", padx=(0, 8))
+        slot.status_label = tk.Label(slot, bg="white", font=("Segoe UI", 11, "bold"), width=14, anchor="w")
+        slot.status_label.pack(side="left", padx=(5, 8))
+        ttk.Button(slot, text="Delete", width=7, command=lambda: self.on_delete(slot.habit_id)).pack(side="left", padx=(8, 8))
+        for child in (slot, *slot.winfo_children()):
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"): child.bind(seq, self.on_mousewheel)
+        slot.window = self.canvas.create_window(20, self.PARKED_Y, window=slot, anchor="nw")
+        return slot
+
+    def fill_slot(self, slot, item):
+        habit_id, name, status = item
+        if slot.name_button.cget("text") != name: slot.name_button.configure(text=name)
+        slot.habit_id = habit_id
+        slot.status_label.configure(text=status, fg=STATUS_COLORS.get(status, NOT_COMPLETED_COLOR))
+
+    def render(self):
+        height = max(self.canvas.winfo_height(), 1)
+        self.canvas.configure(scrollregion=(0, 0, max(self.canvas.winfo_width(), 1), len(self.items) * self.ROW_HEIGHT))
+        first = max(int(self.canvas.canvasy(0)) // self.ROW_HEIGHT, 0)
+        visible = height // self.ROW_HEIGHT + 2
+        while len(self.slots) < min(visible, len(self.items)): self.slots.append(self.make_slot())
+        for offset, slot in enumerate(self.slots):
+            index = first + offset
+            if offset < visible and index < len(self.items):
+                self.fill_slot(slot, self.items[index])
+                self.canvas.coords(slot.window, 20, index * self.ROW_HEIGHT + 4)
+            else:
+                slot.habit_id = None
+                self.canvas.coords(slot.window, 20, self.PARKED_Y)
+
+class CalendarGrid(tk.Frame):
+    """Month grid with a fixed 6x7 set of day buttons that are re-labelled and re-coloured per month."""
+    WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    EMPTY_COLOR, FULL_COLOR = (0xf2, 0xf4, 0xf7), (0x53, 0xba, 0x83)
+
+    def __init__(self, parent, on_select, **kwargs):
+        super().__init__(parent, bg="white", **kwargs)
+        self.on_select, self.year, self.month = on_select, None, None
+        for idx, day in enumerate(self.WEEKDAYS):
+            tk.Label(self, text=day, font=("Segoe UI", 11, "bold"), bg="white", fg="#469ed0", width=8).grid(row=0, column=idx)
+        self.cells = []
+        for r in range(6):
+            for c in range(7):
+                cell = tk.Button(self, width=7, relief="flat", font=("Segoe UI", 11), bd=0, highlightthickness=0)
+                cell.configure(command=lambda cell=cell: self.on_select(self.year, self.month, cell.day))
+                cell.grid(row=r + 1, column=c, padx=4, pady=4)
+                self.cells.append(cell)
+
+    def show(self, year, month, heat):
+        # heat maps day -> completion ratio in [0, 1]; days without an entry are drawn uncoloured.
+        self.year, self.month = year, month
+        weeks = calendar.monthcalendar(year, month)
+        days = [day for week in weeks for day in week] + [0] * (42 - 7 * len(weeks))
+        for cell, day in zip(self.cells, days):
+            cell.day = day
+            if day == 0:
+                cell.configure(text="", state="disabled", bg="white", activebackground="white")
+            else:
+                color = self.heat_color(heat[day]) if day in heat else "white"
+                cell.configure(text=str(day), state="normal", bg=color, activebackground=color)
+
+    @classmethod
+    def heat_color(cls, ratio):
+        return "#" + "".join(f"{round(lo + (hi - lo) * ratio):02x}" for lo, hi in zip(cls.EMPTY_COLOR, cls.FULL_COLOR))